@@ -1,15 +1,96 @@
+import io
+import threading
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
+import webrtcvad
+from scipy.signal import resample_poly
+from concurrent.futures import Future, ThreadPoolExecutor
 from loguru import logger
-from typing import Optional, List
-from src.config import OUTPUT_FILE_NAME, SAMPLE_RATE
+from typing import Iterator, List, Optional, Tuple
+from src.config import (
+    SAMPLE_RATE,
+    CHANNELS,
+    UPLOAD_SAMPLE_RATE,
+    VAD_AGGRESSIVENESS,
+    VAD_FRAME_MS,
+    MIN_CHUNK_SECONDS,
+    MAX_CHUNK_SECONDS,
+    SPLIT_SILENCE_MS,
+    TRIM_VAD_AGGRESSIVENESS,
+    TRIM_FRAME_MS,
+    TRIM_PADDING_MS,
+    MAX_CONCURRENT_TRANSCRIPTIONS,
+)
+from src.gpt_query import transcribe_audio
+
+VAD_FRAME_SAMPLES = SAMPLE_RATE * VAD_FRAME_MS // 1000
+MIN_CHUNK_SAMPLES = SAMPLE_RATE * MIN_CHUNK_SECONDS
+MAX_CHUNK_SAMPLES = SAMPLE_RATE * MAX_CHUNK_SECONDS
+SPLIT_SILENCE_SAMPLES = SAMPLE_RATE * SPLIT_SILENCE_MS // 1000
+TRIM_FRAME_SAMPLES = SAMPLE_RATE * TRIM_FRAME_MS // 1000
+TRIM_PADDING_SAMPLES = SAMPLE_RATE * TRIM_PADDING_MS // 1000
+
+class Transcript:
+    """Text of one recording, filled in chunk by chunk as transcriptions arrive"""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.done = False
+        self.failed = False  # Set when a chunk couldn't be transcribed
+        self._changed = threading.Condition()
+
+    def append(self, text: str):
+        with self._changed:
+            self.parts.append(text.strip())
+            self._changed.notify_all()
+
+    def finish(self):
+        with self._changed:
+            self.done = True
+            self._changed.notify_all()
+
+    def updates(self) -> Iterator[str]:
+        """
+        Yield the text so far each time a chunk is added, until the recording is
+        fully transcribed. Any number of readers can follow it, also once it is done.
+        """
+        seen = 0
+        while True:
+            with self._changed:
+                self._changed.wait_for(lambda: len(self.parts) > seen or self.done)
+                if len(self.parts) == seen:
+                    return
+                seen = len(self.parts)
+                text = " ".join(self.parts)
+            yield text
+
 
 class AudioRecorder:
     def __init__(self):
         self.is_recording = False
-        self.frames: List[np.ndarray] = []
         self.stream = None
+        self.reader: Optional[threading.Thread] = None
+        # Kept after the recording ends so it can be analyzed again
+        self.transcript: Optional[Transcript] = None
+        # Holds the chunk currently being recorded; reused for every chunk and recording
+        self.buffer = np.empty((MAX_CHUNK_SAMPLES, CHANNELS), dtype=np.float32)
+        # Scratch space for the float32 -> int16 conversion the trim VAD reads
+        self._scaled = np.empty_like(self.buffer)
+        self.buf_i16 = np.empty_like(self.buffer, dtype=np.int16)
+        # Block-sized scratch for the reader's per-frame VAD check, so it allocates nothing per block
+        self._block_mono = np.empty(VAD_FRAME_SAMPLES, dtype=np.float32)
+        self._block_i16 = np.empty(VAD_FRAME_SAMPLES, dtype=np.int16)
+        self.vad = webrtcvad.Vad(VAD_AGGRESSIVENESS)
+        self.trim_vad = webrtcvad.Vad(TRIM_VAD_AGGRESSIVENESS)
+        # Chunks are trimmed and encoded here, off the reader thread so it keeps draining
+        # PortAudio; one worker, since the scratch buffers and trim VAD aren't shared safely
+        self.encode_pool = ThreadPoolExecutor(max_workers=1)
+        # Bounds in-flight Whisper requests to stay within OpenAI's rate limits
+        self.upload_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TRANSCRIPTIONS)
+        # Uploads run concurrently; this single worker waits on them in submission order
+        # so each transcript stays in recording order
+        self.delivery_pool = ThreadPoolExecutor(max_workers=1)
 
     def find_blackhole_device(self) -> Optional[int]:
         devices = sd.query_devices()
@@ -19,37 +100,154 @@ class AudioRecorder:
         return None
 
     def start_recording(self):
-        self.is_recording = True
-        self.frames = []
         device_id = self.find_blackhole_device()
+        # No callback: PortAudio buffers the input itself and the reader thread
+        # pulls it, so the realtime audio thread never runs Python code
         self.stream = sd.InputStream(
             samplerate=SAMPLE_RATE,
             device=device_id,
-            callback=self.audio_callback
+            channels=CHANNELS,
+            dtype='float32',
+            latency='high'
         )
         self.stream.start()
-
-    def audio_callback(self, indata, frames, time, status):
-        if status:
-            logger.warning(f"Audio stream status: {status}")
-        if self.is_recording:
-            self.frames.append(indata.copy())
+        self.is_recording = True
+        self.transcript = Transcript()
+        self.reader = threading.Thread(
+            target=self._drain_stream,
+            args=(self.stream, self.transcript),
+            daemon=True
+        )
+        self.reader.start()
 
     def stop_recording(self):
         self.is_recording = False
-        if self.stream:
-            self.stream.stop()
-            self.stream.close()
-        self.save_recording()
-
-    def save_recording(self):
-        if self.frames:
-            full_audio = np.concatenate(self.frames)
-            sf.write(
-                OUTPUT_FILE_NAME,
-                full_audio,
-                SAMPLE_RATE,
-                format='WAV',
-                subtype='PCM_16'
-            )
-            logger.info(f"Saved recording to {OUTPUT_FILE_NAME}")
+        if self.reader:
+            self.reader.join()
+            self.reader = None
+        self.stream = None
+
+    def _drain_stream(self, stream: sd.InputStream, transcript: Transcript):
+        """Read the stream into the chunk buffer, cutting VAD-gated chunks for transcription"""
+        buffer = self.buffer
+        write_idx = 0
+        silent_samples = 0
+        overflows = 0
+        try:
+            while self.is_recording:
+                block, overflowed = stream.read(VAD_FRAME_SAMPLES)
+                overflows += overflowed  # Reported once per chunk, not once per 30 ms block
+                n = len(block)
+                buffer[write_idx:write_idx + n] = block
+                write_idx += n
+                silent_samples = 0 if self._is_speech(block) else silent_samples + n
+                # Cut inside a pause once the chunk is long enough so words aren't split
+                if write_idx + VAD_FRAME_SAMPLES > MAX_CHUNK_SAMPLES or (
+                    write_idx >= MIN_CHUNK_SAMPLES and silent_samples >= SPLIT_SILENCE_SAMPLES
+                ):
+                    self._submit_chunk(write_idx, transcript)
+                    write_idx = 0
+                    silent_samples = 0
+                    if overflows:
+                        logger.warning("Audio input overflowed {} times in the last chunk", overflows)
+                        overflows = 0
+        except Exception as e:
+            logger.error(f"Recording error: {e}")
+        finally:
+            try:
+                stream.stop()
+                stream.close()
+                if write_idx:
+                    self._submit_chunk(write_idx, transcript)
+            except Exception as e:
+                logger.error(f"Failed to flush the last chunk: {e}")
+            # Always mark the end, or analyses would wait for the transcript forever
+            self.delivery_pool.submit(transcript.finish)
+
+    def _is_speech(self, block: np.ndarray) -> bool:
+        n = len(block)
+        mono = self._block_mono[:n]
+        pcm = self._block_i16[:n]
+        np.mean(block, axis=1, out=mono)
+        np.clip(mono, -1.0, 1.0, out=mono)
+        np.multiply(mono, 32767, out=mono)
+        np.copyto(pcm, mono, casting='unsafe')
+        return self.vad.is_speech(pcm.tobytes(), SAMPLE_RATE)
+
+    def _voiced_bounds(self, pcm: np.ndarray) -> Optional[Tuple[int, int]]:
+        """Sample range from the first to the last voiced frame, padded; None if nothing was said"""
+        voiced = [
+            start
+            for start in range(0, len(pcm) - TRIM_FRAME_SAMPLES + 1, TRIM_FRAME_SAMPLES)
+            if self.trim_vad.is_speech(pcm[start:start + TRIM_FRAME_SAMPLES, 0].tobytes(), SAMPLE_RATE)
+        ]
+        if not voiced:
+            return None
+        return (
+            max(voiced[0] - TRIM_PADDING_SAMPLES, 0),
+            min(voiced[-1] + TRIM_FRAME_SAMPLES + TRIM_PADDING_SAMPLES, len(pcm))
+        )
+
+    def _submit_chunk(self, n: int, transcript: Transcript):
+        # Copy out so the reader can refill the buffer while this chunk is encoded
+        encoding = self.encode_pool.submit(self._encode_and_upload, self.buffer[:n].copy())
+        self.delivery_pool.submit(self._deliver_transcript, encoding, transcript)
+
+    def _encode_and_upload(self, audio: np.ndarray) -> Optional[Future]:
+        """Start transcribing a chunk; returns the upload, or None for a silent chunk"""
+        audio_file = self._encode_chunk(audio)
+        if audio_file is None:
+            logger.debug("Skipping silent chunk")
+            return None
+        return self.upload_pool.submit(transcribe_audio, audio_file)
+
+    def _to_pcm16(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Convert float audio to int16 for the VAD in the preallocated buffers, without
+        a full-size allocation per chunk. The result is only valid until the next call.
+        """
+        n, channels = audio.shape
+        scaled = self._scaled[:n, :channels]
+        pcm = self.buf_i16[:n, :channels]
+        np.multiply(audio, 32767.0, out=scaled, casting='same_kind')
+        np.clip(scaled, -32768, 32767, out=scaled)
+        np.rint(scaled, out=scaled)
+        np.copyto(pcm, scaled, casting='unsafe')
+        return pcm
+
+    def _encode_chunk(self, audio: np.ndarray) -> Optional[Tuple[str, bytes, str]]:
+        """
+        Encode a recorded chunk as an in-memory 16 kHz mono Ogg/Opus upload,
+        trimmed to the voiced part. Returns None when the chunk is all silence.
+        """
+        # Whisper bills and spends time on silence too, so only upload the voiced span
+        bounds = self._voiced_bounds(self._to_pcm16(audio))
+        if bounds is None:
+            return None
+        audio = audio[bounds[0]:bounds[1]]
+
+        # Whisper works on 16 kHz mono internally, so anything more is wasted upload
+        if CHANNELS > 1:
+            audio = audio.mean(axis=1, keepdims=True)
+        if SAMPLE_RATE != UPLOAD_SAMPLE_RATE:
+            audio = resample_poly(audio, UPLOAD_SAMPLE_RATE, SAMPLE_RATE, axis=0)
+
+        buf = io.BytesIO()
+        # Float goes straight in: libsndfile encodes Opus from float, so int16 would only add a quantization step
+        sf.write(
+            buf,
+            audio,
+            UPLOAD_SAMPLE_RATE,
+            format='OGG',
+            subtype='OPUS'  # Roughly a tenth of PCM_16 and transparent for speech
+        )
+        return ("chunk.ogg", buf.getvalue(), "audio/ogg")
+
+    def _deliver_transcript(self, encoding: Future, transcript: Transcript):
+        try:
+            upload = encoding.result()
+            if upload is not None:
+                transcript.append(upload.result())
+        except Exception as e:
+            transcript.failed = True
+            logger.error(f"Chunk transcription failed: {e}")
@@ -1,8 +1,43 @@
-OUTPUT_FILE_NAME = "record.wav"
 SAMPLE_RATE = 48000
+CHANNELS = 1
+# Whisper resamples to 16 kHz mono, so chunks are downsampled before upload
+UPLOAD_SAMPLE_RATE = 16000
+
+# Chunked transcription: audio is cut after SPLIT_SILENCE_MS of VAD silence
+# once a chunk reaches MIN_CHUNK_SECONDS, and unconditionally at MAX_CHUNK_SECONDS.
+VAD_AGGRESSIVENESS = 2
+VAD_FRAME_MS = 30
+MIN_CHUNK_SECONDS = 15
+MAX_CHUNK_SECONDS = 25
+SPLIT_SILENCE_MS = 500
+
+# Leading/trailing silence is trimmed from each chunk before upload,
+# keeping TRIM_PADDING_MS around the voiced part.
+TRIM_VAD_AGGRESSIVENESS = 3
+TRIM_FRAME_MS = 20
+TRIM_PADDING_MS = 200
+
+# Whisper requests allowed in flight at once when chunks queue up
+MAX_CONCURRENT_TRANSCRIPTIONS = 8
 
 MODELS = ["gpt-4o-mini", "gpt-4o", "gpt-4-turbo", "gpt-3.5-turbo"]
 DEFAULT_MODEL = MODELS[0]
 
 DEFAULT_POSITION = "Software Developer"
 
+# Repeats of the same hotkey action within this many seconds are ignored
+HOTKEY_DEBOUNCE = 0.2
+
+# The keyboard thread never calls into Tk (those calls block until the main loop
+# runs them); the Tk loop picks up fired hotkeys and captured binds this often.
+# A hotkey waits at most this long, and an idle app wakes only ten times a second
+HOTKEY_POLL_MS = 100
+
+# Streaming answers are re-rendered at line boundaries, at most every
+# STREAM_RENDER_INTERVAL seconds, and at least every STREAM_LINE_TIMEOUT seconds
+STREAM_RENDER_INTERVAL = 0.05
+STREAM_LINE_TIMEOUT = 0.3
+
+# View updates are coalesced and rendered at most once per this many milliseconds
+RENDER_INTERVAL_MS = 33
+
@@ -1,11 +1,16 @@
 import base64
-from typing import Optional
+import functools
+import mmap
+import os
+from typing import Iterator, Optional, Tuple
+import httpx
 from dotenv import load_dotenv
 from loguru import logger
-from openai import ChatCompletion, OpenAI
+from openai import OpenAI, Stream
+from openai.types.chat import ChatCompletionChunk
 import requests
 
-from src.config import DEFAULT_MODEL, DEFAULT_POSITION, OUTPUT_FILE_NAME
+from src.config import DEFAULT_MODEL, DEFAULT_POSITION
 
 SYS_PREFIX: str = "You are interviewing for a "
 SYS_SUFFIX: str = """ position.
@@ -15,34 +20,69 @@ You will receive an audio transcription of the question. It may not be complete.
 SHORT_INSTRUCTION: str = "Concisely respond, limiting your answer to around 100 words. Provide Space/Time complexity for algorithms."
 LONG_INSTRUCTION: str = "Limit long responses for code snippets. If asked about an algorithm, just provide the code, avoid extra text, avoid long one-liners. Default to Python if language is not mentioned. Provide example usage."
 
+IMAGE_SYS_PREFIX: str = "You are analyzing technical interview content for a "
+IMAGE_SYS_SUFFIX: str = """. The user will provide an image containing either:
+- Algorithm challenges
+- Whiteboard designs
+- System diagrams
+- Code snippets
+
+"""
+
 load_dotenv()
 
-client: OpenAI = OpenAI()
+# One long-lived HTTP/2 connection pool: concurrent short/long answer requests
+# share a connection, and idle connections stay warm between questions.
+# A stalled request fails after a minute instead of the library's 10 minute default
+client: OpenAI = OpenAI(
+    timeout=60,
+    http_client=httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+    )
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _system_prompt(position: str, short_answer: bool) -> str:
+    """
+    Build the system prompt for an audio question. Cached so every answer for a
+    position reuses one identical string, which also keeps the prompt prefix
+    stable for OpenAI's prompt caching.
+    """
+    instruction = SHORT_INSTRUCTION if short_answer else LONG_INSTRUCTION
+    return SYS_PREFIX + position + SYS_SUFFIX + instruction
+
+
+@functools.lru_cache(maxsize=32)
+def _image_system_prompt(position: str, short_answer: bool) -> str:
+    """Build the system prompt for a screenshot question."""
+    instruction = SHORT_INSTRUCTION if short_answer else LONG_INSTRUCTION
+    return IMAGE_SYS_PREFIX + position + IMAGE_SYS_SUFFIX + instruction
 
 
-def transcribe_audio(path_to_file: str = OUTPUT_FILE_NAME) -> str:
+def transcribe_audio(audio_file: Tuple[str, bytes, str]) -> str:
     """
-    Transcribe audio from a file using the OpenAI Whisper API.
+    Transcribe an in-memory audio clip using the OpenAI Whisper API.
 
     Args:
-        path_to_file (str, optional): Path to the audio file. Defaults to OUTPUT_FILE_NAME.
+        audio_file (Tuple[str, bytes, str]): File name, encoded audio and MIME type,
+            e.g. ("chunk.ogg", data, "audio/ogg").
 
     Returns:
         str: The audio transcription.
     """
-    logger.debug(f"Transcribing audio from: {path_to_file}...")
+    logger.debug("Transcribing audio from: {}...", audio_file[0])
 
-    with open(path_to_file, "rb") as audio_file:
-        try:
-            transcript: str = client.audio.transcriptions.create(
-                model="whisper-1", file=audio_file, response_format="text"
-            )
-        except Exception as error:
-            logger.error(f"Can't transcribe audio: {error}")
-            raise error
+    try:
+        transcript: str = client.audio.transcriptions.create(
+            model="whisper-1", file=audio_file, response_format="text"
+        )
+    except Exception as error:
+        logger.error(f"Can't transcribe audio: {error}")
+        raise error
 
-    logger.debug("Audio transcribed.")
-    print("Transcription:", transcript)
+    logger.debug("Audio transcribed: {}", transcript)
 
     return transcript
 
@@ -53,9 +93,9 @@ def generate_answer(
     temperature: float = 0.7,
     model: str = DEFAULT_MODEL,
     position: str = DEFAULT_POSITION,
-) -> str:
+) -> Iterator[str]:
     """
-    Generate an answer to the question using the OpenAI API.
+    Stream an answer to the question from the OpenAI API.
 
     Args:
         transcript (str): The audio transcription.
@@ -64,69 +104,78 @@ def generate_answer(
         model (str, optional): The model to use. Defaults to DEFAULT_MODEL.
         position (str, optional): The position to use. Defaults to DEFAULT_POSITION.
 
-    Returns:
-        str: The generated answer.
+    Yields:
+        str: The next piece of the answer as it arrives.
     """
-    # Generate system prompt
-    system_prompt: str = SYS_PREFIX + position + SYS_SUFFIX
-    if short_answer:
-        system_prompt += SHORT_INSTRUCTION
-    else:
-        system_prompt += LONG_INSTRUCTION
+    system_prompt: str = _system_prompt(position, short_answer)
 
     # Generate answer
     try:
-        response: ChatCompletion = client.chat.completions.create(
+        response: Stream[ChatCompletionChunk] = client.chat.completions.create(
             model=model,
             temperature=temperature,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": transcript},
             ],
+            stream=True,
         )
+        try:
+            for chunk in response:
+                if chunk.choices and (delta := chunk.choices[0].delta.content):
+                    yield delta
+        finally:
+            # Release the connection even when the caller stops reading early
+            response.response.close()
     except Exception as error:
         logger.error(f"Can't generate answer: {error}")
         raise error
 
-    return response.choices[0].message.content
+def encode_image(image_path: str) -> str:
+    """
+    Base64-encode an image file for generate_image_answer. Re-analysing an
+    unchanged screenshot reuses the previous encoding.
+    """
+    return _encode_image(image_path, os.path.getmtime(image_path))
+
+
+# Only the latest screenshot is ever analysed, so don't keep older multi-MB encodings alive
+@functools.lru_cache(maxsize=1)
+def _encode_image(image_path: str, mtime: float) -> str:
+    """
+    Base64-encode an image file. The modification time is part of the cache
+    key so a new screenshot at the same path is re-read.
+    """
+    with open(image_path, "rb") as image_file:
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_data:
+            return base64.b64encode(image_data).decode("utf-8")
+
 
 def generate_image_answer(
-    image_path: str,
+    base64_image: str,
     short_answer: bool = True,
     temperature: float = 0.2,
     model: str = DEFAULT_MODEL,
     position: str = DEFAULT_POSITION,
-) -> str:
+) -> Iterator[str]:
     """
-    Analyze an image containing interview content and generate response.
+    Analyze an image containing interview content and stream the response.
     
     Short Answer: Identifies key question/problem in the image
     Long Answer: Detailed solution with analysis and improvements
     
     Args:
-        image_path (str): Path to image file
+        base64_image (str): Base64-encoded image, from encode_image
         short_answer (bool): Concise problem ID vs detailed solution
         temperature (float): 0-2 creativity level
         model (str): GPT-4 vision model recommended
         position (str): Target job position context
     
-    Returns:
-        str: Analysis tailored to requested detail level
+    Yields:
+        str: The next piece of the analysis as it arrives.
     """
     try:
-        # Base system prompt
-        sys_prompt = (f"You are analyzing technical interview content for a {position}. "
-                     "The user will provide an image containing either:\n"
-                     "- Algorithm challenges\n- Whiteboard designs\n- System diagrams\n- Code snippets\n\n")
-
-        # Add instruction based on answer type
-        if short_answer:
-            sys_prompt += ("Concisely respond, limiting your answer to around 100 words. Provide Space/Time complexity for algorithms.")
-        else:
-            sys_prompt += ("Limit long responses for code snippets. If asked about an algorithm, just provide the code, avoid extra text, avoid long one-liners. Default to Python if language is not mentioned. Provide example usage.")
-
-        # Encode image
-        base64_image = base64.b64encode(open(image_path, "rb").read()).decode("utf-8")
+        sys_prompt = _image_system_prompt(position, short_answer)
 
         # Construct messages
         messages = [
@@ -152,14 +201,20 @@ def generate_image_answer(
             }
         ]
 
-        response = client.chat.completions.create(
+        response: Stream[ChatCompletionChunk] = client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
-            max_tokens=600 if short_answer else 1500
+            max_tokens=600 if short_answer else 1500,
+            stream=True,
         )
-
-        return response.choices[0].message.content
+        try:
+            for chunk in response:
+                if chunk.choices and (delta := chunk.choices[0].delta.content):
+                    yield delta
+        finally:
+            # Release the connection even when the caller stops reading early
+            response.response.close()
 
     except Exception as error:
         logger.error(f"Image analysis failed: {error}")
@@ -4,10 +4,15 @@ import time
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from tkhtmlview import HTMLScrolledText 
-import markdown2
+from markdown_it import MarkdownIt
+import functools
+import hashlib
+from collections import OrderedDict
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait
 from loguru import logger
-from src.gpt_query import transcribe_audio, generate_answer, generate_image_answer
+from src.gpt_query import encode_image, generate_answer, generate_image_answer
 from src.config import *
 from src.audio import AudioRecorder
 from src.keybinds import KeybindManager, KeybindDialog
@@ -16,18 +21,119 @@ from PIL import Image, ImageGrab, ImageTk
 from io import BytesIO
 import base64
 import win32gui
+try:
+    # DXGI Desktop Duplication; much faster than GDI but not available everywhere
+    import dxcam
+except ImportError:
+    dxcam = None
+
+def _underscore_text(state, silent):
+    """Keep underscores literal, like markdown2's "code-friendly" extra, so __init__ isn't bolded"""
+    if state.src[state.pos] != "_":
+        return False
+    end = state.pos
+    while end < state.posMax and state.src[end] == "_":
+        end += 1
+    if not silent:
+        state.pending += state.src[state.pos:end]
+    state.pos = end
+    return True
+
+# CommonMark includes fenced code blocks (markdown2's "fenced-code-blocks" extra);
+# underscores are taken out of emphasis so only * and ** emphasize
+_MD = MarkdownIt("commonmark")
+_MD.inline.ruler.before("emphasis", "underscore_text", _underscore_text)
+
+# Rendered HTML keyed by a 16-byte BLAKE2b digest of the markdown, so long answers
+# aren't kept alive as cache keys; least recently used entries are evicted first
+_MD_CACHE_SIZE = 256
+_md_cache = OrderedDict()
+
+# Shared workers for answer requests and screenshot captures, reused instead of
+# starting a thread per job; two answers plus a capture fit with room to spare
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="interview-io")
+
+# Maximized windows hang their resize border a few pixels past the screen edges
+_MAXIMIZED_OVERHANG = 16
+
+def _md_to_html(content):
+    """Convert markdown to HTML; placeholders and repeated answers hit the cache"""
+    key = hashlib.blake2b(content.encode(), digest_size=16).digest()
+    html = _md_cache.get(key)
+    if html is None:
+        html = _md_cache[key] = _MD.render(content)
+        if len(_md_cache) > _MD_CACHE_SIZE:
+            _md_cache.popitem(last=False)
+    else:
+        _md_cache.move_to_end(key)
+    return html
+
+@functools.lru_cache(maxsize=8)
+def _screenshot_html(image_path, mtime, size):
+    """
+    Thumbnail an image file into an inline <img> tag. mtime and size are part of
+    the cache key so re-analysing an unchanged screenshot skips decode and re-encode.
+    """
+    return _thumbnail_html(Image.open(image_path))
+
+def _thumbnail_html(img):
+    """Thumbnail an image (in place) into an inline <img> tag"""
+    # Create thumbnail
+    img.thumbnail((300, 300), Image.Resampling.LANCZOS)
+
+    # Convert to base64 (fast compression; the PNG is only an in-memory transport)
+    buffered = BytesIO()
+    img.save(buffered, format="PNG", optimize=False, compress_level=1)
+    img_str = base64.b64encode(buffered.getvalue()).decode()
+
+    # Create HTML with image
+    return f"""
+        <img src="data:image/png;base64,{img_str}" 
+                style="max-width: 300px; margin: 10px 0; border-radius: 5px; border: 1px solid #454545">
+    """
+
+BG_COLOR = "#2d2d2d"
+TEXT_COLOR = "#ffffff"
+
+# ttk styles applied once at startup: base elements match the main theme,
+# "Sash" handles the paned window dividers
+_STYLE_SPEC = (
+    ('.', {'background': BG_COLOR, 'foreground': TEXT_COLOR}),
+    ('TFrame', {'background': BG_COLOR}),
+    ('TButton', {'background': '#404040', 'foreground': TEXT_COLOR, 'padding': 6}),
+    ('TLabel', {'background': BG_COLOR, 'foreground': TEXT_COLOR}),
+    ('TEntry', {'fieldbackground': '#FFFFFF', 'foreground': "#000000"}),
+    ('TCombobox', {'fieldbackground': '#FFFFFF', 'foreground': "#000000"}),
+    ('Settings.TButton', {'background': '#505050', 'font': ('Helvetica', 10)}),
+    ('Sash', {'gripcount': 0, 'width': 3, 'background': '#404040', 'troughcolor': BG_COLOR}),
+)
+_STYLE_MAPS = (
+    ('TButton', {'background': [('active', '#505050')]}),
+    ('Settings.TButton', {'background': [('active', '#606060')]}),
+)
 
 class InterviewGUI:
+    _HTML_WRAP = '<span style="color: white; font-family: Georgia, serif; font-size: 10px">%s</span>'
+    _TRAY_IMAGE = Image.new('RGB', (64, 64), '#2d2d2d')
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("( > w < ; )")
-        self.keybind_manager = KeybindManager()
-        self.keybind_manager.callbacks.append(self._handle_hotkey)
+        self.keybind_manager = KeybindManager(self.root)
+        self.keybind_manager.add_callback(self._handle_hotkey)
         self._configure_window()
         self._setup_state()
         self._create_widgets()
         self._create_tray_icon()
         self.audio = AudioRecorder()
+        self.answer_futures = []
+        # Captures share the I/O pool, so serialize them to never write screenshot.png concurrently
+        self.capture_lock = threading.Lock()
+        self._cam = self._create_camera()
+        self.answer_generation = 0
+        # One long-lived worker runs analyses in order; the bounded queue stops clicks piling up
+        self.analysis_queue = queue.Queue(maxsize=2)
+        threading.Thread(target=self._analysis_worker, daemon=True).start()
         self.tray_active = False
         self.tray_lock = threading.Lock()
 
@@ -41,21 +147,30 @@ class InterviewGUI:
 
     def _setup_state(self):
         self.is_recording = False
-        self.audio_frames = []
         self.current_position = DEFAULT_POSITION
+        self._pending = {}
+        self._flush_scheduled = False
+        self._last_markdown = {}
+        self._last_fire = {}
+        self._last_screenshot = None
+        self._awaited_transcript = None
+        self._capture = None
 
     def _create_tray_icon(self):
         if not hasattr(self, 'tray_icon'):
-            img = Image.new('RGB', (64, 64), '#2d2d2d')
             self.tray_icon = pystray.Icon(
                 "interview_app",
-                img,
+                self._TRAY_IMAGE,
                 "( > w < ; )",
-                pystray.Menu(
-                    pystray.MenuItem('Open', self._show_window),
-                    pystray.MenuItem('Exit', self.on_close)
-                )
+                self._create_tray_menu()
             )
+            self.tray_started = threading.Event()
+
+    def _start_tray_icon(self):
+        """Start the tray icon's event loop once; hiding/showing only toggles the window"""
+        if not self.tray_started.is_set():
+            self.tray_started.set()
+            self.tray_icon.run_detached()
 
     def _create_tray_menu(self):
         return pystray.Menu(
@@ -68,9 +183,7 @@ class InterviewGUI:
             if not self.tray_active:
                 self.root.withdraw()
                 self.tray_active = True
-                # Don't use run_detached - just update visibility
-                if not self.tray_icon._running:
-                    threading.Thread(target=self.tray_icon.run, daemon=True).start()
+                self._start_tray_icon()
         
     def _show_window(self):
         with self.tray_lock:
@@ -80,36 +193,13 @@ class InterviewGUI:
                 # Don't stop the icon, just hide the window
 
     def _configure_styles(self):
-        bg_color = "#2d2d2d"
-        text_color = "#ffffff"
         # Configure root element backgrounds
-        self.root.configure(bg=bg_color)
+        self.root.configure(bg=BG_COLOR)
         
-        # Style base elements (match to main theme)
-        self.style.configure('.', 
-                            background=bg_color,
-                            foreground=text_color)
-        self.style.configure('TFrame', background=bg_color)
-        self.style.configure('TButton', 
-                          background='#404040', 
-                          foreground=text_color,
-                          padding=6)
-        self.style.map('TButton', background=[('active', '#505050')])
-        self.style.configure('TLabel', background=bg_color, foreground=text_color)
-        self.style.configure('TEntry', fieldbackground='#FFFFFF', foreground="#000000")
-        self.style.configure('TCombobox', fieldbackground='#FFFFFF', foreground="#000000")
-        self.style.configure('Settings.TButton', 
-                        background='#505050',
-                        font=('Helvetica', 10))
-        self.style.map('Settings.TButton',
-                    background=[('active', '#606060')])
-
-        # Handle sash (divider) elements
-        self.style.configure('Sash',
-                            gripcount=0,
-                            width=3,
-                            background='#404040',
-                            troughcolor=bg_color)
+        for name, options in _STYLE_SPEC:
+            self.style.configure(name, **options)
+        for name, options in _STYLE_MAPS:
+            self.style.map(name, **options)
         
         # Force dark sash style for paned windows
         self.style.layout('TPanedWindow',
@@ -185,13 +275,6 @@ class InterviewGUI:
         self.full_answer_view = HTMLScrolledText(main_pane, background="#1e1e1e")
         main_pane.add(self.full_answer_view, weight=4)  # 4 parts of total width
         
-        # Force initial size constraints
-        self.root.update_idletasks()
-        left_pane.pane(0, weight=1)  # Question pane
-        left_pane.pane(1, weight=4)  # Short answer
-        main_pane.pane(0, weight=1)  # Left column
-        main_pane.pane(1, weight=4)  # Right column
-        
         self._initialize_content_views()
 
     def _initialize_content_views(self):
@@ -202,6 +285,12 @@ class InterviewGUI:
             view.set_html(initial_html)
 
     def _handle_hotkey(self, action):
+        # Drop repeats of the same action (e.g. a held-down key) inside the debounce window
+        now = time.monotonic()
+        if now - self._last_fire.get(action, 0.0) < HOTKEY_DEBOUNCE:
+            return
+        self._last_fire[action] = now
+
         handler = {
             'record': self.toggle_recording,
             'analyze_audio': self.start_audio_analysis,
@@ -214,8 +303,13 @@ class InterviewGUI:
             logger.warning(f"Unknown action: {action}")
 
     def take_screenshot(self):
+        # Grab and PNG-encode off the Tk/hotkey thread; PIL releases the GIL for both
+        self._capture = _IO_POOL.submit(self._capture_screenshot)
+
+    def _capture_screenshot(self):
         try:
-            success = self.capture_focused_window()
+            with self.capture_lock:
+                success = self.capture_focused_window()
             if success:
                 logger.info("Saved screenshot.png")
             else:
@@ -235,113 +329,213 @@ class InterviewGUI:
                 self.audio.start_recording()
                 self.record_btn.config(text="⏹ Stop Recording")
 
-    def _record_audio(self):
-        try:
-            self.audio.start_recording()  # Starts async recording
-            while self.audio.is_recording:  # Wait while recording
-                self.root.update()  # Keep GUI responsive
-                time.sleep(0.1)  # Prevent busy wait
-        except Exception as e:
-            logger.error(f"Recording error: {e}")
-            self.audio.stop_recording()
-
     def start_audio_analysis(self):
+        transcript = self.audio.transcript
+        if transcript is None:
+            logger.error("No recording found")
+            return
+        if transcript is self._awaited_transcript:
+            logger.warning("Already waiting for this recording, ignoring request")
+            return
+
+        # Followed on the I/O pool rather than the analysis worker, so a screenshot
+        # analysis isn't stuck behind a recording that is still going.
+        # Tk variables are read here, on the Tk thread, not from the pool
+        self._awaited_transcript = transcript
+        _IO_POOL.submit(
+            self._full_audio_analysis_pipeline, transcript, self.position_entry.get(), self.model_var.get()
+        )
         self._update_markdown(self.question_view, "*Transcribing audio...*")
-        threading.Thread(target=self._full_audio_analysis_pipeline).start()
 
     def start_screenshot_analysis(self):
-        if not os.path.exists("screenshot.png"):
+        # A capture still in flight counts; the pipeline waits for it
+        if self._capture is None and not os.path.exists("screenshot.png"):
             logger.error("No screenshot found")
             return
             
-        self._update_markdown(self.question_view, "*Analyzing screenshot...*")
-        threading.Thread(target=self._full_screenshot_analysis_pipeline).start()
+        pipeline = functools.partial(
+            self._full_screenshot_analysis_pipeline, self.position_entry.get(), self.model_var.get()
+        )
+        if self._queue_analysis(pipeline):
+            self._update_markdown(self.question_view, "*Analyzing screenshot...*")
 
-    def _full_screenshot_analysis_pipeline(self):
+    def _queue_analysis(self, pipeline):
+        """Hand a pipeline to the analysis worker; repeated requests beyond the queue are dropped"""
         try:
-            self._display_screenshot("screenshot.png")
-            position = self.position_entry.get()
-            model = self.model_var.get()
-            
-            short_answer = generate_image_answer(
-                "screenshot.png",
-                short_answer=True,
-                model=model,
-                position=position
-            )
-            
-            full_answer = generate_image_answer(
-                "screenshot.png",
-                short_answer=False,
-                model=model,
-                position=position
-            )
-            
-            self._update_markdown(self.short_answer_view, short_answer)
-            self._update_markdown(self.full_answer_view, full_answer)
+            self.analysis_queue.put_nowait(pipeline)
+            return True
+        except queue.Full:
+            logger.warning("Analysis already queued, ignoring request")
+            return False
+
+    def _analysis_worker(self):
+        while True:
+            pipeline = self.analysis_queue.get()
+            try:
+                pipeline()
+            except Exception as e:
+                logger.error(f"Analysis failed: {e}")
+
+    def _full_screenshot_analysis_pipeline(self, position, model):
+        try:
+            # Supersede first so answers to the previous question can't overwrite the placeholders
+            generation = self._supersede_answers()
+
+            # Let a capture requested before this analysis finish, so it isn't analysed
+            # as the old screenshot or a half-written file
+            if self._capture is not None:
+                wait([self._capture])
+            with self.capture_lock:
+                # Use a fresh capture once; later re-analyses go through the file cache
+                image, self._last_screenshot = self._last_screenshot, None
+                self._display_screenshot("screenshot.png", image)
+                # Encoded once here; both requests send the same string
+                base64_image = encode_image("screenshot.png")
+
+            # Both answers are independent network calls, so request them concurrently
+            self.answer_futures = [
+                _IO_POOL.submit(
+                    self._stream_answer,
+                    view,
+                    generate_image_answer(
+                        base64_image,
+                        short_answer=short_answer,
+                        model=model,
+                        position=position
+                    ),
+                    generation
+                )
+                for view, short_answer in ((self.short_answer_view, True), (self.full_answer_view, False))
+            ]
             
         except Exception as e:
             logger.error(f"Screenshot analysis failed: {e}")
-            self._update_markdown(self.question_view, "Analysis failed - check logs")
+            self._post_markdown(self.question_view, "Analysis failed - check logs")
 
-    def _full_audio_analysis_pipeline(self):
-        transcript = transcribe_audio(OUTPUT_FILE_NAME)
-        self._display_transcript(transcript)
-        
-        position = self.position_entry.get()
-        model = self.model_var.get()
+    def _full_audio_analysis_pipeline(self, transcript, position, model):
+        # Partial transcripts arrive while recording; a finished recording yields its full text at once
+        text = ""
+        try:
+            for text in transcript.updates():
+                self._display_transcript(text)
+        finally:
+            self._awaited_transcript = None
+        if not text:
+            # Every chunk was silent or failed to upload, so there is no question to answer
+            self._display_transcript(
+                "*Transcription failed - check logs*" if transcript.failed else "*No speech detected*"
+            )
+            return
         
-        self._generate_answers(transcript, position, model)
+        # Answers start on the analysis worker like every other analysis, so they supersede in order
+        self.analysis_queue.put(functools.partial(self._generate_answers, text, position, model))
 
     def _display_transcript(self, text):
-        self._update_markdown(self.question_view, text)
+        self._post_markdown(self.question_view, text)
 
-    def _display_screenshot(self, image_path):
-        """Display thumbnail in question pane"""
+    def _display_screenshot(self, image_path, image=None):
+        """Display thumbnail in question pane, from the in-memory capture when there is one"""
         try:
-            self._update_markdown(self.short_answer_view, "Generating short answer...")
-            self._update_markdown(self.full_answer_view, "Generating detailed answer...")
+            self._post_markdown(self.short_answer_view, "Generating short answer...")
+            self._post_markdown(self.full_answer_view, "Generating detailed answer...")
 
-            # Create thumbnail
-            img = Image.open(image_path)
-            img.thumbnail((300, 300))
-            
-            # Convert to base64
-            buffered = BytesIO()
-            img.save(buffered, format="PNG")
-            img_str = base64.b64encode(buffered.getvalue()).decode()
-            
-            # Create HTML with image
-            html_content = f"""
-                <img src="data:image/png;base64,{img_str}" 
-                        style="max-width: 300px; margin: 10px 0; border-radius: 5px; border: 1px solid #454545">
-            """
-            self._update_markdown(self.question_view, html_content, is_html=True)
+            if image is not None:
+                # thumbnail() resizes in place, so leave the captured image untouched
+                html_content = _thumbnail_html(image.copy())
+            else:
+                stat = os.stat(image_path)
+                html_content = _screenshot_html(image_path, stat.st_mtime, stat.st_size)
+            self._post_markdown(self.question_view, html_content, is_html=True)
             
         except Exception as e:
             logger.error(f"Failed to display screenshot: {e}")
-            self._update_markdown(self.question_view, "*Loaded screenshot*")
+            self._post_markdown(self.question_view, "*Loaded screenshot*")
 
     def _generate_answers(self, transcript, position, model):
-        self._update_markdown(self.short_answer_view, "Generating short answer...")
-        self._update_markdown(self.full_answer_view, "Generating detailed answer...")
-        
-        short_answer = generate_answer(
-            transcript, 
-            short_answer=True,
-            model=model,
-            position=position
-        )
-        
-        full_answer = generate_answer(
-            transcript,
-            short_answer=False,
-            model=model,
-            position=position
-        )
-        
-        self._update_markdown(self.short_answer_view, short_answer)
-        self._update_markdown(self.full_answer_view, full_answer)
+        # Supersede first so answers to the previous question can't overwrite the placeholders
+        generation = self._supersede_answers()
+
+        self._post_markdown(self.short_answer_view, "Generating short answer...")
+        self._post_markdown(self.full_answer_view, "Generating detailed answer...")
+
+        # Both answers are independent network calls, so request them concurrently
+        self.answer_futures = [
+            _IO_POOL.submit(
+                self._stream_answer,
+                view,
+                generate_answer(
+                    transcript,
+                    short_answer=short_answer,
+                    model=model,
+                    position=position
+                ),
+                generation
+            )
+            for view, short_answer in ((self.short_answer_view, True), (self.full_answer_view, False))
+        ]
+
+    def _supersede_answers(self):
+        """Cancel answers still queued or streaming for the previous question; returns the new generation"""
+        self.answer_generation += 1
+        for future in self.answer_futures:
+            future.cancel()
+        self.answer_futures = []
+        return self.answer_generation
+
+    def _stream_answer(self, view, chunks, generation):
+        """
+        Render a streamed answer as it arrives. Re-renders happen when a line is
+        completed (at most every STREAM_RENDER_INTERVAL), or after STREAM_LINE_TIMEOUT
+        so a long line still shows progress.
+        """
+        answer = ""
+        last_render = 0.0
+        try:
+            for chunk in chunks:
+                if generation != self.answer_generation:
+                    chunks.close()  # Stop reading the superseded response
+                    return
+                answer += chunk
+                now = time.monotonic()
+                if now - last_render >= STREAM_LINE_TIMEOUT or (
+                    "\n" in chunk and now - last_render >= STREAM_RENDER_INTERVAL
+                ):
+                    last_render = now
+                    self._post_markdown(view, answer)
+        except Exception as e:
+            logger.error(f"Answer generation failed: {e}")
+            answer = "Generation failed - check logs"
+        # A stream can end just after a new question started; its views belong to that one now
+        if generation == self.answer_generation:
+            self._post_markdown(view, answer)
+
+    def _create_camera(self):
+        """DXGI capture of the primary display, or None to use GDI (e.g. multi-GPU or RDP sessions)"""
+        if dxcam is None:
+            return None
+        try:
+            return dxcam.create(output_color="RGB")
+        except Exception as e:
+            logger.warning(f"DXGI capture unavailable, using GDI: {e}")
+            return None
+
+    def _grab_window(self, rect):
+        """Grab a screen rectangle, through DXGI when it lies on the primary display"""
+        # Windows reaching onto another monitor go through GDI, which captures all screens
+        if self._cam is not None and (
+            rect[0] >= -_MAXIMIZED_OVERHANG and rect[1] >= -_MAXIMIZED_OVERHANG
+            and rect[2] <= self._cam.width + _MAXIMIZED_OVERHANG
+            and rect[3] <= self._cam.height + _MAXIMIZED_OVERHANG
+        ):
+            # DXGI only accepts on-screen regions, so trim the overhang
+            left, top = max(rect[0], 0), max(rect[1], 0)
+            right, bottom = min(rect[2], self._cam.width), min(rect[3], self._cam.height)
+            if left < right and top < bottom:
+                # None means the screen hasn't changed since the last grab, so fall through to GDI
+                frame = self._cam.grab(region=(left, top, right, bottom))
+                if frame is not None:
+                    return Image.fromarray(frame)
+        return ImageGrab.grab(bbox=rect, all_screens=True)
 
     def capture_focused_window(self):
         """Simplified screenshot capture"""
@@ -350,29 +544,51 @@ class InterviewGUI:
             if not hwnd:
                 return False
             rect = win32gui.GetWindowRect(hwnd)
-            left, top, right, bottom = rect
-            ImageGrab.grab((left, top, right, bottom)).save("screenshot.png")
+            img = self._grab_window(rect)
+            img.save("screenshot.png", compress_level=1)
+            # Keep the image for the thumbnail once it is saved; the file is only read by the analysis request
+            self._last_screenshot = img
             return True
         except Exception as e:
             logger.error(f"Screenshot failed: {str(e)}")
             return False
-            
-        except Exception as e:
-            logger.error(f"Screenshot failed: {str(e)}")
-            return False
+
+    def _post_markdown(self, widget, content, is_html=False):
+        """Thread-safe _update_markdown: hands the update to the Tk thread"""
+        self.root.after(0, self._update_markdown, widget, content, is_html)
 
     def _update_markdown(self, widget, content, is_html=False):
-        """Updated to handle HTML input"""
-        full_html = f"""
-            <span style="color: white; 
-            font-family: Georgia, serif;
-            font-size: 10px">
-                {content if is_html else markdown2.markdown(content, extras=["fenced-code-blocks", "code-friendly"])}
-            </span>
         """
-        
-        widget.set_html(full_html)
-        widget.see("end")
+        Queue content for a view (Tk thread only; workers use _post_markdown). Updates
+        are coalesced and rendered at most once per RENDER_INTERVAL_MS, so only the
+        latest content per view is drawn.
+        """
+        self._pending[widget] = (content, is_html)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(RENDER_INTERVAL_MS, self._flush_pending)
+
+    def _flush_pending(self):
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+        for widget, (content, is_html) in pending.items():
+            self._render_markdown(widget, content, is_html)
+
+    def _render_markdown(self, widget, content, is_html=False):
+        """Updated to handle HTML input"""
+        last = self._last_markdown.get(widget, "")
+        if content == last:
+            return  # Already showing exactly this
+        self._last_markdown[widget] = content
+
+        # Only follow output that was appended, and only if the user hasn't scrolled up to read
+        first, last_visible = widget.yview()
+        follow = len(content) > len(last) and last_visible > 0.98
+        if not is_html:
+            content = _md_to_html(content)
+        widget.set_html(self._HTML_WRAP % content)
+        # set_html re-inserts all text, which scrolls to the top; put a reader back where they were
+        widget.yview_moveto(1.0 if follow else first)
 
     def on_close(self):
         logger.info("Full shutdown initiated")
@@ -404,11 +620,7 @@ class InterviewGUI:
         os._exit(0)  # Direct exit, not sys.exit()
 
     def run(self):
-        self.keybind_manager.root = self.root
-        self.keybind_manager._register_hotkeys()
-        
-        # Start tray icon in a DAEMON thread
-        threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        self._start_tray_icon()
         
         # Run the main Tkinter event loop
         self.root.mainloop()
@@ -1,10 +1,37 @@
 import json
+try:
+    # Faster C parser, used when installed
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(data):
+        return json.dumps(data, indent=2).encode()
+from functools import lru_cache, partial
 from pathlib import Path
-from tkinter import ttk, messagebox, Toplevel, Event
-import keyboard
+from tkinter import ttk, messagebox, Toplevel, Event, Tk
 from threading import Thread
-from queue import Queue
-from keyboard import start_recording, stop_recording
+from queue import Empty, Queue
+from src.config import HOTKEY_POLL_MS
+
+_kb = None
+
+def _get_kb():
+    """Import keyboard on first use; importing it starts its hook machinery"""
+    global _kb
+    if _kb is None:
+        import keyboard as _kb
+    return _kb
+
+# Binds are almost always one of a handful of strings, so parse each only once
+@lru_cache(maxsize=256)
+def _normalize(name):
+    return _get_kb().normalize_name(name)
 
 DEFAULT_KEYBINDS = {
     'record': 'ctrl+r',
@@ -14,46 +41,70 @@ DEFAULT_KEYBINDS = {
 }
 
 class KeybindManager:
-    def __init__(self, config_path='keybinds.config'):
+    def __init__(self, root: Tk, config_path='keybinds.config'):
+        self.root = root
         self.config_path = Path(config_path)
         self.config_path.parent.mkdir(exist_ok=True, parents=True)
+        self._saved_keybinds = None  # What the config file holds, once read or written
         self.keybinds = self._load_keybinds()
         self.hotkey_handles = {}
-        self.callbacks = []
-        if not self.config_path.exists():
+        # Built once so re-registering on save doesn't create new closures
+        self._action_triggers = {action: partial(self._trigger, action) for action in DEFAULT_KEYBINDS}
+        self.callbacks = ()
+        self.capturing = 0  # Keybind entries currently capturing a new bind
+        self._fired = Queue()
+        self.root.after(HOTKEY_POLL_MS, self._dispatch)
+        if not self._config_existed:
             self.save_keybinds(DEFAULT_KEYBINDS)
-        else:  # Add explicit registration of initial hotkeys
-            self._register_hotkeys()
+        self._register_hotkeys()
     
     def add_callback(self, callback):
-        self.callbacks.append(callback)
+        """Call callback(action) on the Tk main loop whenever an action's hotkey fires"""
+        self.callbacks += (callback,)
     
-    def _register_hotkeys(self):
-        # Clear existing hotkeys
-        for handle in self.hotkey_handles.values():
-            keyboard.remove_hotkey(handle)
-
-        # Register new hotkeys
-        self.hotkey_handles = {
-            'record': keyboard.add_hotkey(self.keybinds['record'], lambda: self._trigger('record')),
-            'analyze_audio': keyboard.add_hotkey(self.keybinds['analyze_audio'], lambda: self._trigger('analyze_audio')),
-            'analyze_screenshot': keyboard.add_hotkey(self.keybinds['analyze_screenshot'], lambda: self._trigger('analyze_screenshot')),
-            'screenshot': keyboard.add_hotkey(self.keybinds['screenshot'], lambda: self._trigger('screenshot'))
-        }
+    def _register_hotkeys(self, actions=DEFAULT_KEYBINDS):
+        """(Re)register the hotkeys for the given actions, all of them by default"""
+        for action in actions:
+            # Clear the existing hotkey
+            if action in self.hotkey_handles:
+                _get_kb().remove_hotkey(self.hotkey_handles[action])
+
+            # Register the new one
+            self.hotkey_handles[action] = _get_kb().add_hotkey(
+                self.keybinds[action], self._action_triggers[action]
+            )
     
     def _trigger(self, action):
-        for callback in self.callbacks:
-            callback(action)
+        # Runs on the keyboard hook thread. Only enqueue: any Tk call made here
+        # would block this thread until the main loop got around to running it
+        if self.capturing:
+            return  # The keys are being pressed to set a bind, not to act
+        self._fired.put(action)
+
+    def _dispatch(self):
+        """Run the callbacks for hotkeys fired since the last poll, on the Tk main loop"""
+        try:
+            while True:
+                action = self._fired.get_nowait()
+                for callback in self.callbacks:
+                    callback(action)
+        except Empty:
+            pass
+        finally:
+            self.root.after(HOTKEY_POLL_MS, self._dispatch)
 
     def _load_keybinds(self):
+        # Read directly rather than checking exists() first: one syscall, and no race
+        self._config_existed = True
         try:
-            if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    loaded = json.load(f)
-                    return {
-                        k: keyboard.normalize_name(v)
-                        for k, v in loaded.items()
-                    }
+            loaded = _loads(self.config_path.read_bytes())
+            self._saved_keybinds = {
+                k: _normalize(v)
+                for k, v in loaded.items()
+            }
+            return self._saved_keybinds.copy()
+        except FileNotFoundError:
+            self._config_existed = False
             return DEFAULT_KEYBINDS.copy()
         except Exception:
             return DEFAULT_KEYBINDS.copy()
@@ -61,20 +112,22 @@ class KeybindManager:
 
     def save_keybinds(self, keybinds):
         try:
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            
             # Normalize before saving
             normalized = {
-                k: keyboard.normalize_name(v)
+                k: _normalize(v)
                 for k, v in keybinds.items()
             }
             
-            with open(self.config_path, 'w') as f:
-                json.dump(normalized, f, indent=2)
+            # Saving unchanged binds touches neither the file nor the hooks
+            if normalized != self._saved_keybinds:
+                self.config_path.write_bytes(_dumps(normalized))
+                self._saved_keybinds = normalized
             
-            # IMPORTANT: Update in-memory AND trigger refresh
+            # IMPORTANT: Update in-memory AND refresh the hotkeys that changed
+            changed = [k for k, v in normalized.items() if v != self.keybinds.get(k)]
             self.keybinds = normalized.copy()
-            self._register_hotkeys()
+            if changed:
+                self._register_hotkeys(changed)
             
             return True
         except Exception as e:
@@ -83,6 +136,13 @@ class KeybindManager:
 
 
 class KeybindDialog(Toplevel):
+    _ACTION_LABELS = (
+        ('record', 'Record Key:'),
+        ('analyze_audio', 'Analyze Audio:'),
+        ('analyze_screenshot', 'Analyze Screenshot:'),
+        ('screenshot', 'Take Screenshot:')
+    )
+
     def __init__(self, parent, keybind_manager):
         super().__init__(parent)
         self.configure(bg="#2d2d2d")
@@ -96,19 +156,14 @@ class KeybindDialog(Toplevel):
         main_frame.pack(padx=10, pady=10)
 
         self.entries = {}
-        for i, (action, label) in enumerate({
-            'record': 'Record Key:',
-            'analyze_audio': 'Analyze Audio:', 
-            'analyze_screenshot': 'Analyze Screenshot:',
-            'screenshot': 'Take Screenshot:'
-        }.items()):
+        for i, (action, label) in enumerate(self._ACTION_LABELS):
             ttk.Label(main_frame, text=label).grid(row=i, column=0, sticky='w')
-            entry = KeybindEntry(main_frame, width=20)
+            entry = KeybindEntry(main_frame, self.keybind_manager, width=20)
             entry.grid(row=i, column=1, padx=5, pady=5)
             self.entries[action] = entry
 
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=4, columnspan=2, pady=10)  # Row after last keybind entry
+        button_frame.grid(row=len(self._ACTION_LABELS), columnspan=2, pady=10)  # Row after last keybind entry
         ttk.Button(button_frame, text="Save", command=self._save).pack(side='left', padx=5)
         ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side='left', padx=5)
 
@@ -135,10 +190,12 @@ class KeybindDialog(Toplevel):
         return bind_str
     
 class KeybindEntry(ttk.Entry):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs, state='readonly')
+    def __init__(self, parent, keybind_manager, *args, **kwargs):
+        super().__init__(parent, *args, **kwargs, state='readonly')
+        self.keybind_manager = keybind_manager
         self.current_bind = ''
         self.bind('<Button-1>', self._start_listening)
+        self.bind('<Destroy>', self._stop_listening)
         self.listening = False
 
     def _start_listening(self, event):
@@ -148,35 +205,62 @@ class KeybindEntry(ttk.Entry):
         self.listening = True
         self.config(state='normal')
         self.delete(0, 'end')
-        self.insert(0, 'Press NEW keys (1 sec)...')
+        self.insert(0, 'Press NEW keys...')
         self.config(state='readonly')
         
-        # Cancel any previous key reg
-        keyboard.unhook_all()
-        keyboard.start_recording()
+        # Collect keys with a scoped hook; unhook_all() would also drop the app's hotkeys
+        self._collected = []
+        self._complete = False
+        self._hook = _get_kb().hook(self._collect_event)
+        # The app's hotkeys stay registered but don't fire while the new bind is pressed
+        self.keybind_manager.capturing += 1
         
-        # Capture fresh keys
-        self.master.after(1000, self._process_recorded)
+        # The hook thread only sets a flag, which Tk checks here
+        self._poll = self.after(HOTKEY_POLL_MS, self._check_complete)
+        # Safety net in case a full combination is never pressed
+        self._timeout = self.after(2000, self._finish)
 
-    def _process_recorded(self):
-        pressed = keyboard.stop_recording()
-        new_keys = []
-        seen = set()
-        
-        for event in pressed:
-            if event.event_type == 'down' and event.name not in seen:
-                seen.add(event.name)
-                new_keys.append(event.name)
-                
-        clean_bind = '+'.join(new_keys).lower()
+    def _collect_event(self, event):
+        """Runs on the keyboard hook thread, so only records; Tk picks up the result"""
+        if self._complete:
+            return
+        if event.event_type == 'down':
+            self._collected.append(event.name)
+        elif any(not _get_kb().is_modifier(name) for name in self._collected):
+            # A key was released after a non-modifier went down: the combination is done
+            self._complete = True
+
+    def _check_complete(self):
+        if self._complete:
+            self._finish()
+        else:
+            self._poll = self.after(HOTKEY_POLL_MS, self._check_complete)
+
+    def _finish(self):
+        if not self.listening:
+            return
+        self._stop_listening()
+
+        # Held keys repeat their down events; dict keys dedupe while keeping press order.
+        # Keep the old bind if nothing was pressed before the timeout
+        clean_bind = '+'.join(dict.fromkeys(self._collected)).lower() or self.current_bind
         self.set_bind(clean_bind)
+
+    def _stop_listening(self, event=None):
+        """Remove only this entry's hook; also runs if the dialog closes mid-capture"""
+        if not self.listening:
+            return
         self.listening = False
+        _get_kb().unhook(self._hook)
+        self.keybind_manager.capturing -= 1
+        self.after_cancel(self._poll)
+        self.after_cancel(self._timeout)
 
     def set_bind(self, value):
         self.current_bind = value
         self.config(state='normal')
         self.delete(0, 'end')
-        self.insert(0, value.replace('_', '+'))  # Fix Windows key formatting
+        self.insert(0, value.replace('_', '+') if '_' in value else value)  # Fix Windows key formatting
         self.config(state='readonly')
 
     def get_bind(self):